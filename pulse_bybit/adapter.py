@@ -12,16 +12,33 @@ Example:
     >>> response = adapter.send(msg)
 """
 
+import asyncio
 import hashlib
 import hmac
+import sys
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional "async" extra
+    httpx = None
 
 from pulse.message import PulseMessage
 from pulse.adapter import PulseAdapter, AdapterError, AdapterConnectionError
 
+from pulse_bybit.version import __version__
+
 
 # Bybit V5 API endpoints
 ENDPOINTS = {
@@ -46,6 +63,54 @@ ACTION_MAP = {
     "ACT.QUERY.BALANCE": "wallet_balance",
 }
 
+# Bybit operation -> BybitAdapter method that builds its request
+_BUILDERS = {
+    "query": "_build_query_request",
+    "order_status": "_build_status_request",
+    "place_order": "_build_order_request",
+    "cancel_order": "_build_cancel_request",
+    "open_orders": "_build_open_orders_request",
+    "wallet_balance": "_build_balance_request",
+}
+
+_SUPPORTED_ACTIONS = tuple(ACTION_MAP)
+_SUPPORTED_ACTIONS_SET = frozenset(ACTION_MAP)
+
+# Seconds an unsigned market-data response may be reused; override per
+# endpoint name with config={"cache_ttl": {"tickers": 0.5}}
+CACHE_TTL = {
+    "tickers": 0.25,
+    "kline": 1.0,
+    "orderbook": 0.1,
+}
+
+# Upper bound on cached responses; expired entries are purged first
+CACHE_MAX_ENTRIES = 256
+
+# Sent on every request. Accept-Encoding lists only the codecs urllib3 can
+# decode here (gzip, deflate, plus br/zstd when brotli/zstandard are installed).
+DEFAULT_HEADERS = {
+    "User-Agent": f"pulse-bybit/{__version__}",
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+    "Connection": "keep-alive",
+}
+
+# Exceptions raised by the async transport, checked in this order
+if httpx is not None:
+    _ASYNC_TIMEOUT_ERRORS: Tuple[type, ...] = (httpx.TimeoutException, TimeoutError)
+    _ASYNC_CONNECTION_ERRORS: Tuple[type, ...] = (httpx.TransportError, ConnectionError)
+    _ASYNC_STATUS_ERRORS: Tuple[type, ...] = (httpx.HTTPStatusError,)
+else:  # pragma: no cover - optional "async" extra
+    _ASYNC_TIMEOUT_ERRORS = (TimeoutError,)
+    _ASYNC_CONNECTION_ERRORS = (ConnectionError,)
+    _ASYNC_STATUS_ERRORS = ()
+
+
+@lru_cache(maxsize=1024)
+def _norm_symbol(symbol: str) -> str:
+    """Uppercase and intern a trading symbol, so repeats share one object."""
+    return sys.intern(symbol.upper())
+
 
 class BybitAdapter(PulseAdapter):
     """PULSE adapter for Bybit exchange (V5 API).
@@ -61,6 +126,11 @@ class BybitAdapter(PulseAdapter):
         - ACT.TRANSACT.REQUEST — place an order (BUY/SELL)
         - ACT.CANCEL — cancel an order
 
+    Concurrent sends are available through ``send_async()`` and
+    ``send_many()``, which multiplex requests over a single HTTP/2
+    connection (requires the ``async`` extra). ``send_batch()`` answers
+    many ticker queries with one ``/v5/market/tickers`` call.
+
     Example:
         >>> # Switch from Binance to Bybit — one line change
         >>> # adapter = BinanceAdapter(api_key="...", api_secret="...")
@@ -72,6 +142,29 @@ class BybitAdapter(PulseAdapter):
         >>> response = adapter.send(msg)
     """
 
+    # PulseAdapter has no __slots__, so instances keep a __dict__ for the
+    # base attributes; the adapter's own hot-path state lives in slots.
+    __slots__ = (
+        "_api_key",
+        "_api_secret",
+        "_testnet",
+        "_session",
+        "_async_client",
+        "_async_loop",
+        "_recv_window",
+        "_api_key_b",
+        "_recv_window_b",
+        "_hmac_template",
+        "_time_offset_ns",
+        "_time_synced_at",
+        "_time_sync_interval",
+        "_batch_ts",
+        "_time_sync_task",
+        "_cache_ttl",
+        "_cache",
+        "_builders",
+    )
+
     BASE_URL = "https://api.bybit.com"
     TESTNET_URL = "https://api-testnet.bybit.com"
 
@@ -92,87 +185,112 @@ class BybitAdapter(PulseAdapter):
         self._api_secret = api_secret
         self._testnet = testnet
         self._session: Optional[requests.Session] = None
+        self._async_client: Optional["httpx.AsyncClient"] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the client is bound to
         self._recv_window = "20000"
-        self._time_offset = 0  # Local vs server time difference in ms
+        # Signing inputs that never change, encoded once
+        self._api_key_b = api_key.encode("utf-8") if api_key else b""
+        self._recv_window_b = self._recv_window.encode("utf-8")
+        self._hmac_template: Optional["hmac.HMAC"] = None  # Keyed lazily on first sign
+        self._time_offset_ns = 0  # Local vs server time difference in ns
+        self._time_synced_at: Optional[float] = None  # monotonic() of last server time sync
+        self._time_sync_interval = self.config.get("time_sync_interval", 600.0)  # seconds
+        self._batch_ts: Optional[str] = None  # Shared timestamp inside signing_batch()
+        self._time_sync_task: Optional["asyncio.Future[None]"] = None  # In-flight async sync
+        cache_ttl = {**CACHE_TTL, **self.config.get("cache_ttl", {})}
+        unknown = sorted(set(cache_ttl) - set(CACHE_TTL))
+        if unknown:
+            raise AdapterError(
+                f"Unknown cache_ttl endpoint(s) {unknown}. Valid: {sorted(CACHE_TTL)}"
+            )
+        self._cache_ttl = {ENDPOINTS[name]: ttl for name, ttl in cache_ttl.items() if ttl > 0}
+        self._cache: Dict[tuple, Tuple[float, bytes]] = {}  # key -> (expires_at, raw body)
+        # PULSE action -> bound request builder, one dict lookup per message
+        self._builders: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            action: getattr(self, _BUILDERS[operation]) for action, operation in ACTION_MAP.items()
+        }
 
     def connect(self) -> None:
-        """Initialize HTTP session and verify connectivity."""
-        self._session = requests.Session()
+        """Initialize HTTP session and sync with Bybit server time.
 
-        try:
-            resp = self._session.get(f"{self.base_url}{ENDPOINTS['server_time']}", timeout=10)
-            resp.raise_for_status()
-            server_time = resp.json().get("result", {}).get("timeSecond", None)
-            if server_time:
-                self._time_offset = int(server_time) * 1000 - int(time.time() * 1000)
-            self.connected = True
-        except requests.ConnectionError as e:
-            raise AdapterConnectionError(f"Cannot reach Bybit API: {e}") from e
-        except requests.HTTPError as e:
-            raise AdapterConnectionError(f"Bybit API error: {e}") from e
+        Optional: without it the session is created on the first send and
+        the clock is synced on the first signed request.
+        """
+        self._session = self._new_session()
+        self._sync_time()
+        self.connected = True
 
     def disconnect(self) -> None:
-        """Close HTTP session."""
+        """Close HTTP session and the async client, if one was opened.
+
+        From async code prefer ``await adapter.aclose()``, which can wait
+        for the async client to shut down.
+        """
         if self._session:
             self._session.close()
         self._session = None
+        self._drop_async_client()
+        self._cache.clear()
         self.connected = False
 
+    async def aclose(self) -> None:
+        """Close the async HTTP/2 client and the sync HTTP session."""
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if client is not None and loop in (None, asyncio.get_running_loop()):
+            await client.aclose()
+        self.disconnect()
+
+    async def __aenter__(self) -> "BybitAdapter":
+        self._ensure_async_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def to_native(self, message: PulseMessage) -> Dict[str, Any]:
         """Convert PULSE message to Bybit API request."""
         action = message.content["action"]
         params = message.content.get("parameters", {})
-        operation = ACTION_MAP.get(action)
+        builder = self._builders.get(action)
 
-        if not operation:
+        if builder is None:
             raise AdapterError(
-                f"Unsupported action '{action}'. Supported: {list(ACTION_MAP.keys())}"
+                f"Unsupported action '{action}'. Supported: {list(_SUPPORTED_ACTIONS)}"
             )
 
-        if operation == "query":
-            return self._build_query_request(params)
-        elif operation == "place_order":
-            return self._build_order_request(params)
-        elif operation == "cancel_order":
-            return self._build_cancel_request(params)
-        elif operation == "order_status":
-            return self._build_status_request(params)
-        elif operation == "open_orders":
-            return self._build_open_orders_request(params)
-        elif operation == "wallet_balance":
-            return self._build_balance_request(params)
-
-        raise AdapterError(f"Unknown operation: {operation}")
+        # Normalize the symbol once here; builders use it as-is
+        symbol = params.get("symbol")
+        if symbol is not None:
+            params = {**params, "symbol": _norm_symbol(symbol)}
+
+        return builder(params)
 
     def call_api(self, native_request: Dict[str, Any]) -> Dict[str, Any]:
         """Execute Bybit API call."""
         if not self._session:
             self._ensure_session()
 
-        method = native_request["method"]
-        url = f"{self.base_url}{native_request['endpoint']}"
-        params = native_request.get("params", {})
-        signed = native_request.get("signed", False)
+        cache_key = self._cache_key(native_request)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return self._parse_response(cached)
 
         try:
+            if self._needs_time_sync(native_request):
+                self._ensure_time_sync()
+            method, url, payload, headers = self._prepare_request(native_request)
             if method == "GET":
-                headers = self._sign_get(params) if signed else {}
-                resp = self._session.get(url, params=params, headers=headers, timeout=10)
-            elif method == "POST":
-                headers = self._sign_post(params) if signed else {"Content-Type": "application/json"}
-                resp = self._session.post(url, json=params, headers=headers, timeout=10)
+                resp = self._session.get(url, params=payload, headers=headers, timeout=10)
             else:
-                raise AdapterError(f"Unknown HTTP method: {method}")
+                resp = self._session.post(url, data=payload, headers=headers, timeout=10)
 
-            data = resp.json()
-
-            # Bybit V5 uses retCode for errors
-            ret_code = data.get("retCode", 0)
-            if ret_code != 0:
-                ret_msg = data.get("retMsg", "Unknown error")
-                raise AdapterError(f"Bybit error {ret_code}: {ret_msg}")
-
-            return data.get("result", data)
+            result = self._parse_response(resp.content)
+            if cache_key is not None:
+                self._cache_put(cache_key, resp.content)
+            return result
 
         except (requests.ConnectionError, ConnectionError) as e:
             raise AdapterConnectionError(f"Cannot reach Bybit: {e}") from e
@@ -183,6 +301,169 @@ class BybitAdapter(PulseAdapter):
         except Exception as e:
             raise AdapterError(f"Bybit request failed: {e}") from e
 
+    async def call_api_async(self, native_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute Bybit API call over the shared async HTTP/2 client."""
+        self._ensure_async_client()
+
+        cache_key = self._cache_key(native_request)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return self._parse_response(cached)
+
+        try:
+            if self._needs_time_sync(native_request):
+                await self._ensure_time_sync_async()
+            method, url, payload, headers = self._prepare_request(native_request)
+            if method == "GET":
+                resp = await self._async_client.get(url, params=payload, headers=headers)
+            else:
+                resp = await self._async_client.post(url, content=payload, headers=headers)
+
+            result = self._parse_response(resp.content)
+            if cache_key is not None:
+                self._cache_put(cache_key, resp.content)
+            return result
+
+        except _ASYNC_TIMEOUT_ERRORS as e:
+            raise AdapterConnectionError(f"Bybit request timed out: {e}") from e
+        except _ASYNC_CONNECTION_ERRORS as e:
+            raise AdapterConnectionError(f"Cannot reach Bybit: {e}") from e
+        except AdapterError:
+            raise
+        except Exception as e:
+            raise AdapterError(f"Bybit request failed: {e}") from e
+
+    async def send_async(self, message: PulseMessage) -> PulseMessage:
+        """Send a PULSE message without blocking the event loop.
+
+        Async counterpart of ``send()``; requests share one multiplexed
+        HTTP/2 connection, so many can be in flight at once.
+        """
+        self._track_request()
+
+        try:
+            native_request = self.to_native(message)
+            native_response = await self.call_api_async(native_request)
+            return self._wrap_response(message, self.from_native(native_response))
+
+        except (AdapterError, AdapterConnectionError):
+            self._error_count += 1
+            raise
+        except Exception as e:
+            self._error_count += 1
+            raise AdapterError(f"Adapter '{self.name}' failed: {e}") from e
+
+    async def send_many(self, messages: List[PulseMessage]) -> List[PulseMessage]:
+        """Send several PULSE messages concurrently.
+
+        Responses are returned in the same order as ``messages``.
+
+        Example:
+            >>> async def poll():
+            ...     async with adapter:
+            ...         return await adapter.send_many([msg_btc, msg_eth])
+            >>> responses = asyncio.run(poll())
+        """
+        return list(await asyncio.gather(*(self.send_async(m) for m in messages)))
+
+    def send_batch(self, messages: List[PulseMessage]) -> List[PulseMessage]:
+        """Send several PULSE messages, coalescing ticker queries.
+
+        Price/24h ``ACT.QUERY.DATA`` queries for the same category are
+        answered from a single ``/v5/market/tickers`` call (Bybit returns
+        every symbol when none is given), so polling 30 symbols costs one
+        request instead of 30. All other messages, and symbols missing from
+        the bulk response, go through ``send()`` individually; if the bulk
+        call itself fails, its messages are retried one by one.
+
+        Messages are processed in input order; a bulk call goes out at the
+        position of the first message of its category. A message that
+        fails gets an ERROR response (see ``create_error_response()``) in
+        its slot instead of aborting the batch, so every message is tried.
+        Each message counts as one request in ``health_check()``, and as an
+        error only if it ends up failing.
+
+        Responses are returned in the same order as ``messages``.
+
+        Example:
+            >>> responses = adapter.send_batch([msg_btc, msg_eth, msg_sol])
+            >>> failed = [r for r in responses if r.type == "ERROR"]
+        """
+        buckets: Dict[str, List[PulseMessage]] = {}
+        for message in messages:
+            category = self._ticker_category(message)
+            if category is not None:
+                buckets.setdefault(category, []).append(message)
+        coalesced = {category: bucket for category, bucket in buckets.items() if len(bucket) > 1}
+
+        tickers: Dict[str, Optional[Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+        responses: List[PulseMessage] = []
+        for message in messages:
+            category = self._ticker_category(message)
+            if category not in coalesced:
+                responses.append(self._send_or_error(message, tracked=False))
+                continue
+
+            if category not in tickers:
+                tickers[category] = self._fetch_tickers(category, coalesced[category])
+            fetched = tickers[category]
+            ticker = None
+            if fetched is not None:
+                result, by_symbol = fetched
+                ticker = by_symbol.get(_norm_symbol(message.content["parameters"]["symbol"]))
+
+            if ticker is None:
+                responses.append(self._send_or_error(message, tracked=True))
+            else:
+                response = self.from_native({**result, "list": [ticker]})
+                responses.append(self._wrap_response(message, response))
+
+        return responses
+
+    def _fetch_tickers(
+        self, category: str, bucket: List[PulseMessage]
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """One bulk ticker call for ``bucket``: (result, tickers by symbol), or None on failure."""
+        for _ in bucket:
+            self._track_request()
+
+        fresh = any(message.content["parameters"].get("fresh") for message in bucket)
+        try:
+            result = self.call_api({
+                "method": "GET",
+                "endpoint": ENDPOINTS["tickers"],
+                "params": {"category": category},
+                "signed": False,
+                "fresh": fresh,
+            })
+        except AdapterError:
+            return None  # Caller falls back to individual sends
+
+        return result, {ticker.get("symbol"): ticker for ticker in result.get("list", [])}
+
+    def _send_or_error(self, message: PulseMessage, tracked: bool) -> PulseMessage:
+        """Send one batch message, turning a failure into an ERROR response."""
+        try:
+            return self._send_tracked(message) if tracked else self.send(message)
+        except AdapterConnectionError as e:
+            return self.create_error_response("META.ERROR.UNAVAILABLE", str(e), original=message)
+        except AdapterError as e:
+            return self.create_error_response("META.ERROR.UNKNOWN", str(e), original=message)
+
+    def _send_tracked(self, message: PulseMessage) -> PulseMessage:
+        """``send()`` for a message whose request was already counted."""
+        try:
+            native_response = self.call_api(self.to_native(message))
+            return self._wrap_response(message, self.from_native(native_response))
+
+        except (AdapterError, AdapterConnectionError):
+            self._error_count += 1
+            raise
+        except Exception as e:
+            self._error_count += 1
+            raise AdapterError(f"Adapter '{self.name}' failed: {e}") from e
+
     def from_native(self, native_response: Any) -> PulseMessage:
         """Convert Bybit response to PULSE message."""
         return PulseMessage(
@@ -192,8 +473,145 @@ class BybitAdapter(PulseAdapter):
         )
 
     @property
-    def supported_actions(self) -> List[str]:
-        return list(ACTION_MAP.keys())
+    def supported_actions(self) -> Tuple[str, ...]:
+        return _SUPPORTED_ACTIONS
+
+    def supports(self, action: str) -> bool:
+        return action in _SUPPORTED_ACTIONS_SET
+
+    @contextmanager
+    def signing_batch(self) -> Iterator[None]:
+        """Sign every request inside the block with one shared timestamp.
+
+        Saves a clock read per request when a burst of signed calls goes
+        out at once. Keep the block short: Bybit rejects requests whose
+        timestamp is older than the recv window (20 s).
+
+        Example:
+            >>> with adapter.signing_batch():
+            ...     for order in orders:
+            ...         adapter.send(order)
+        """
+        outer = self._batch_ts
+        if outer is None:
+            self._batch_ts = ""  # Stamped by the first signed request in the block
+        try:
+            yield
+        finally:
+            self._batch_ts = outer
+
+    # --- Transport Helpers ---
+
+    def _prepare_request(
+        self, native_request: Dict[str, Any]
+    ) -> Tuple[str, str, Union[Dict[str, Any], bytes, None], Dict[str, str]]:
+        """Resolve method, URL, payload and (signed) headers for a native request.
+
+        The payload is the query params for GET and the serialized JSON body
+        for POST. Signed GETs carry their pre-encoded query in the URL instead,
+        so the bytes on the wire are exactly the bytes that were signed.
+        """
+        method = native_request["method"]
+        url = f"{self.base_url}{native_request['endpoint']}"
+        params = native_request.get("params", {})
+        signed = native_request.get("signed", False)
+
+        if method == "GET":
+            if signed:
+                headers, query = self._sign_get(params)
+                return method, f"{url}?{query}" if query else url, None, headers
+            return method, url, params, {}
+        elif method == "POST":
+            if signed:
+                headers, body = self._sign_post(params)
+            else:
+                headers, body = {"Content-Type": "application/json"}, orjson.dumps(params)
+            return method, url, body, headers
+
+        raise AdapterError(f"Unknown HTTP method: {method}")
+
+    def _parse_response(self, body: bytes) -> Dict[str, Any]:
+        """Decode a Bybit V5 response body, raising on a non-zero retCode."""
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise AdapterError("Bybit returned non-JSON body") from e
+
+        # Bybit V5 uses retCode for errors
+        ret_code = data.get("retCode", 0)
+        if ret_code != 0:
+            ret_msg = data.get("retMsg", "Unknown error")
+            raise AdapterError(f"Bybit error {ret_code}: {ret_msg}")
+
+        return data.get("result", data)
+
+    def _cache_key(self, native_request: Dict[str, Any]) -> Optional[tuple]:
+        """Cache key for a cacheable request, or None if it must hit the API.
+
+        Only unsigned GETs to endpoints with a TTL are cached, and a request
+        built from ``parameters={"fresh": True}`` always bypasses the cache.
+        """
+        if (
+            native_request["method"] != "GET"
+            or native_request.get("signed", False)
+            or native_request.get("fresh", False)
+            or native_request["endpoint"] not in self._cache_ttl
+        ):
+            return None
+        params = native_request.get("params", {})
+        return (native_request["endpoint"], tuple(sorted(params.items())))
+
+    def _cache_get(self, key: tuple) -> Optional[bytes]:
+        """Return the raw body of a cached response that has not expired yet.
+
+        Bodies are decoded again on every hit, so callers never share (and
+        cannot mutate) another caller's result.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if time.monotonic() >= expires_at:
+            # Drop stale entries so a failing refresh never serves old data
+            del self._cache[key]
+            return None
+        return body
+
+    def _cache_put(self, key: tuple, body: bytes) -> None:
+        now = time.monotonic()
+        if len(self._cache) >= CACHE_MAX_ENTRIES:
+            self._cache = {k: entry for k, entry in self._cache.items() if entry[0] > now}
+            while len(self._cache) >= CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]  # Oldest insertion first
+        self._cache[key] = (now + self._cache_ttl[key[0]], body)
+
+    def _ticker_category(self, message: PulseMessage) -> Optional[str]:
+        """Category of a ticker query that ``send_batch()`` can coalesce, else None."""
+        if message.content["action"] != "ACT.QUERY.DATA":
+            return None
+        params = message.content.get("parameters", {})
+        if params.get("type", "price") not in ("price", "24h") or not params.get("symbol"):
+            return None
+        return params.get("category", "spot")
+
+    def _track_request(self) -> None:
+        """Update request stats the same way ``send()`` does."""
+        self._request_count += 1
+        self._last_request_time = (
+            datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        )
+
+    def _wrap_response(self, request: PulseMessage, response: PulseMessage) -> PulseMessage:
+        """Set response envelope fields the same way ``send()`` does."""
+        response.type = "RESPONSE"
+        response.envelope["receiver"] = request.envelope["sender"]
+        response.envelope["sender"] = f"adapter:{self.name}"
+        return response
+
+    @property
+    def _time_offset(self) -> int:
+        """Local vs server time difference in ms (kept for back-compat)."""
+        return self._time_offset_ns // 1_000_000
 
     # --- Request Builders ---
 
@@ -202,16 +620,18 @@ class BybitAdapter(PulseAdapter):
         symbol = params.get("symbol")
         query_type = params.get("type", "price")
         category = params.get("category", "spot")
+        fresh = bool(params.get("fresh", False))
 
         if query_type in ("price", "24h"):
             req_params = {"category": category}
             if symbol:
-                req_params["symbol"] = symbol.upper()
+                req_params["symbol"] = symbol
             return {
                 "method": "GET",
                 "endpoint": ENDPOINTS["tickers"],
                 "params": req_params,
                 "signed": False,
+                "fresh": fresh,
             }
 
         elif query_type == "klines":
@@ -222,11 +642,12 @@ class BybitAdapter(PulseAdapter):
                 "endpoint": ENDPOINTS["kline"],
                 "params": {
                     "category": category,
-                    "symbol": symbol.upper(),
+                    "symbol": symbol,
                     "interval": params.get("interval", "60"),
                     "limit": params.get("limit", 100),
                 },
                 "signed": False,
+                "fresh": fresh,
             }
 
         elif query_type == "depth":
@@ -237,10 +658,11 @@ class BybitAdapter(PulseAdapter):
                 "endpoint": ENDPOINTS["orderbook"],
                 "params": {
                     "category": category,
-                    "symbol": symbol.upper(),
+                    "symbol": symbol,
                     "limit": params.get("limit", 20),
                 },
                 "signed": False,
+                "fresh": fresh,
             }
 
         raise AdapterError(f"Unknown query type '{query_type}'. Use: price, 24h, klines, depth.")
@@ -254,7 +676,7 @@ class BybitAdapter(PulseAdapter):
 
         order_params = {
             "category": params.get("category", "spot"),
-            "symbol": params["symbol"].upper(),
+            "symbol": params["symbol"],
             "side": "Buy" if params["side"].upper() == "BUY" else "Sell",
             "orderType": params.get("order_type", "Market"),
             "qty": str(params["quantity"]),
@@ -286,7 +708,7 @@ class BybitAdapter(PulseAdapter):
             "endpoint": ENDPOINTS["cancel_order"],
             "params": {
                 "category": params.get("category", "spot"),
-                "symbol": params["symbol"].upper(),
+                "symbol": params["symbol"],
                 "orderId": str(params["order_id"]),
             },
             "signed": True,
@@ -304,7 +726,7 @@ class BybitAdapter(PulseAdapter):
             "endpoint": ENDPOINTS["order_detail"],
             "params": {
                 "category": params.get("category", "spot"),
-                "symbol": params["symbol"].upper(),
+                "symbol": params["symbol"],
                 "orderId": str(params["order_id"]),
             },
             "signed": True,
@@ -314,7 +736,7 @@ class BybitAdapter(PulseAdapter):
         """Build open orders query."""
         req_params = {"category": params.get("category", "spot")}
         if "symbol" in params:
-            req_params["symbol"] = params["symbol"].upper()
+            req_params["symbol"] = params["symbol"]
 
         return {
             "method": "GET",
@@ -336,55 +758,210 @@ class BybitAdapter(PulseAdapter):
 
     # --- Signing ---
 
-    def _sign_get(self, params: Dict[str, Any]) -> Dict[str, str]:
-        """Generate authentication headers for GET requests."""
+    def _sign_get(self, params: Dict[str, Any]) -> Tuple[Dict[str, str], str]:
+        """Generate authentication headers and the signed query string for GET requests."""
         if not self._api_key or not self._api_secret:
             raise AdapterError("API key and secret required for signed requests.")
 
-        timestamp = str(int(time.time() * 1000) + self._time_offset)
-        param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-        sign_str = f"{timestamp}{self._api_key}{self._recv_window}{param_str}"
-
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),
-            sign_str.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        timestamp = self._signing_timestamp()
+        param_str = urlencode(params, doseq=True)
+        signature = self._signature(
+            timestamp.encode("utf-8")
+            + self._api_key_b
+            + self._recv_window_b
+            + param_str.encode("utf-8")
+        )
 
-        return {
+        headers = {
             "X-BAPI-API-KEY": self._api_key,
             "X-BAPI-SIGN": signature,
             "X-BAPI-TIMESTAMP": timestamp,
             "X-BAPI-RECV-WINDOW": self._recv_window,
         }
+        return headers, param_str
 
-    def _sign_post(self, params: Dict[str, Any]) -> Dict[str, str]:
-        """Generate authentication headers for POST requests."""
+    def _sign_post(self, params: Dict[str, Any]) -> Tuple[Dict[str, str], bytes]:
+        """Generate authentication headers and the signed JSON body for POST requests."""
         if not self._api_key or not self._api_secret:
             raise AdapterError("API key and secret required for signed requests.")
 
-        import json
-        timestamp = str(int(time.time() * 1000) + self._time_offset)
-        param_str = json.dumps(params)
-        sign_str = f"{timestamp}{self._api_key}{self._recv_window}{param_str}"
-
-        signature = hmac.new(
-            self._api_secret.encode("utf-8"),
-            sign_str.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        timestamp = self._signing_timestamp()
+        body = orjson.dumps(params)
+        signature = self._signature(
+            timestamp.encode("utf-8") + self._api_key_b + self._recv_window_b + body
+        )
 
-        return {
+        headers = {
             "X-BAPI-API-KEY": self._api_key,
             "X-BAPI-SIGN": signature,
             "X-BAPI-TIMESTAMP": timestamp,
             "X-BAPI-RECV-WINDOW": self._recv_window,
             "Content-Type": "application/json",
         }
+        return headers, body
+
+    def _signing_timestamp(self) -> str:
+        """Timestamp for the next signature, shared inside ``signing_batch()``."""
+        if self._batch_ts is None:
+            return self._timestamp()
+        if not self._batch_ts:
+            self._batch_ts = self._timestamp()
+        return self._batch_ts
+
+    def _timestamp(self) -> str:
+        """Current server-aligned time in milliseconds, as sent in X-BAPI-TIMESTAMP."""
+        return str((time.time_ns() + self._time_offset_ns) // 1_000_000)
+
+    def _signature(self, sign_str: bytes) -> str:
+        """HMAC-SHA256 hex signature of ``sign_str``.
+
+        The secret is absorbed into the hasher once; each call clones that
+        keyed state and only hashes the variable tail.
+        """
+        if self._hmac_template is None:
+            self._hmac_template = hmac.new(
+                self._api_secret.encode("utf-8"), digestmod=hashlib.sha256
+            )
+        h = self._hmac_template.copy()
+        h.update(sign_str)
+        return h.hexdigest()
 
     def _ensure_session(self) -> None:
         if not self._session:
-            self._session = requests.Session()
+            self._session = self._new_session()
+
+    def _needs_time_sync(self, native_request: Dict[str, Any]) -> bool:
+        """Whether a request will be signed; without credentials signing fails first."""
+        return (
+            native_request.get("signed", False)
+            and bool(self._api_key and self._api_secret)
+            and self._time_sync_due()
+        )
+
+    def _time_sync_due(self) -> bool:
+        """True before the first server time sync and once the last one is stale."""
+        return (
+            self._time_synced_at is None
+            or time.monotonic() - self._time_synced_at >= self._time_sync_interval
+        )
+
+    def _ensure_time_sync(self) -> None:
+        """Sync with server time over the sync transport when due."""
+        if self._time_sync_due():
+            self._sync_time()
+
+    async def _ensure_time_sync_async(self) -> None:
+        """Sync with server time over the async client when due.
+
+        Concurrent signed requests share one in-flight probe; it is shielded
+        so cancelling one caller (e.g. via ``asyncio.wait_for``) never cancels
+        the probe the others are waiting on.
+        """
+        if not self._time_sync_due():
+            return
+        task = self._time_sync_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._time_sync_task = asyncio.ensure_future(self._sync_time_async())
+        await asyncio.shield(task)
+
+    def _sync_time(self) -> None:
+        """Fetch Bybit server time and update the local clock offset."""
+        self._ensure_session()
+
+        try:
+            resp = self._session.get(f"{self.base_url}{ENDPOINTS['server_time']}", timeout=10)
+            resp.raise_for_status()
+            self._apply_server_time(resp.content)
+        except requests.ConnectionError as e:
+            raise AdapterConnectionError(f"Cannot reach Bybit API: {e}") from e
+        except requests.Timeout as e:
+            raise AdapterConnectionError(f"Bybit server time request timed out: {e}") from e
+        except requests.HTTPError as e:
+            raise AdapterConnectionError(f"Bybit API error: {e}") from e
+
+    async def _sync_time_async(self) -> None:
+        """Async counterpart of ``_sync_time()``, using the async client."""
+        try:
+            resp = await self._async_client.get(f"{self.base_url}{ENDPOINTS['server_time']}")
+            resp.raise_for_status()
+            self._apply_server_time(resp.content)
+        except _ASYNC_TIMEOUT_ERRORS as e:
+            raise AdapterConnectionError(f"Bybit server time request timed out: {e}") from e
+        except _ASYNC_CONNECTION_ERRORS as e:
+            raise AdapterConnectionError(f"Cannot reach Bybit API: {e}") from e
+        except _ASYNC_STATUS_ERRORS as e:
+            raise AdapterConnectionError(f"Bybit API error: {e}") from e
+
+    def _apply_server_time(self, body: bytes) -> None:
+        """Update the clock offset from a ``/v5/market/time`` response body."""
+        server_time = orjson.loads(body).get("result", {}).get("timeSecond", None)
+        if server_time:
+            self._time_offset_ns = int(server_time) * 1_000_000_000 - time.time_ns()
+        self._time_synced_at = time.monotonic()
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """Create a session whose keep-alive pool survives burst traffic.
+
+        Only GETs are retried: replaying a POST could place an order twice.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
+        return session
+
+    def _ensure_async_client(self) -> None:
+        """Open the async client, or reopen it if it belongs to another event loop.
+
+        An httpx connection pool is tied to the loop it was first used on, so
+        a client left over from an earlier ``asyncio.run()`` cannot be reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop not in (None, loop):
+            self._drop_async_client()
+
+        if self._async_client is None:
+            if httpx is None:
+                raise AdapterError(
+                    "Async transport requires httpx. "
+                    "Install with: pip install 'pulse-bybit[async]'"
+                )
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": DEFAULT_HEADERS["User-Agent"]},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=10.0,
+            )
+        self._async_loop = loop
+
+    def _drop_async_client(self) -> None:
+        """Forget the async client, closing it if its event loop still allows."""
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if client is None or loop is None or loop.is_closed():
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop.run_until_complete(client.aclose())
+        # Otherwise another loop is running here and the client's idle loop
+        # cannot be driven from inside it; the client is simply dropped.
 
     def __repr__(self) -> str:
         return (
@@ -1,7 +1,14 @@
 """Tests for Bybit adapter. All mocked — no real API calls."""
 
+import asyncio
+import hashlib
+import hmac
+import time
+
+import orjson
 import pytest
-from unittest.mock import MagicMock, patch
+import requests
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from pulse.message import PulseMessage
 from pulse.adapter import AdapterError, AdapterConnectionError
@@ -16,15 +23,57 @@ def mock_response(result_data, ret_code=0, ret_msg="OK"):
     """Create a mock Bybit V5 response."""
     mock = MagicMock()
     mock.status_code = 200
-    mock.json.return_value = {
+    mock.content = orjson.dumps({
         "retCode": ret_code,
         "retMsg": ret_msg,
         "result": result_data,
-    }
+    })
     mock.raise_for_status.return_value = None
     return mock
 
 
+class LoopBoundClient:
+    """Stand-in for httpx.AsyncClient: usable only on the event loop it first ran on."""
+
+    def __init__(self, **kwargs):
+        self.loop = None
+        self.closed = False
+
+    async def get(self, url, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        if self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+        return mock_response({"list": [], "timeSecond": "1700000000"})
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TimeCountingClient(LoopBoundClient):
+    """LoopBoundClient that counts server time probes and yields between requests."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.time_probes = 0
+
+    async def get(self, url, **kwargs):
+        if url.endswith("/v5/market/time"):
+            self.time_probes += 1
+        await asyncio.sleep(0)
+        return await super().get(url, **kwargs)
+
+
+class SlowTimeClient(TimeCountingClient):
+    """TimeCountingClient whose server time probe takes a while to answer."""
+
+    async def get(self, url, **kwargs):
+        if url.endswith("/v5/market/time"):
+            await asyncio.sleep(0.05)
+        return await super().get(url, **kwargs)
+
+
 # --- Fixtures ---
 
 
@@ -32,6 +81,7 @@ def mock_response(result_data, ret_code=0, ret_msg="OK"):
 def adapter():
     a = BybitAdapter(api_key="test-key", api_secret="test-secret")
     a._session = MagicMock()
+    a._time_synced_at = time.monotonic()
     a.connected = True
     return a
 
@@ -109,10 +159,122 @@ class TestBybitAdapterInit:
         adapter = BybitAdapter(testnet=True)
         assert adapter.base_url == "https://api-testnet.bybit.com"
 
+    def test_adapter_state_in_slots(self):
+        adapter = BybitAdapter(api_key="key", api_secret="secret")
+        assert "_session" not in vars(adapter)
+        assert "_api_key" not in vars(adapter)
+
     def test_repr(self):
         adapter = BybitAdapter()
         assert "testnet=False" in repr(adapter)
 
+    def test_ensure_session_is_tuned(self):
+        adapter = BybitAdapter()
+        adapter._ensure_session()
+        http_adapter = adapter._session.get_adapter("https://api.bybit.com")
+        assert http_adapter._pool_maxsize == 64
+        assert http_adapter.max_retries.total == 3
+        assert "POST" not in http_adapter.max_retries.allowed_methods
+        assert "gzip" in adapter._session.headers["Accept-Encoding"]
+        assert adapter._session.headers["User-Agent"].startswith("pulse-bybit/")
+
+
+# --- Test Connection / Time Sync ---
+
+
+class TestTimeSync:
+
+    @pytest.fixture
+    def lazy_adapter(self):
+        a = BybitAdapter(api_key="test-key", api_secret="test-secret")
+        a._session = MagicMock()
+        a._session.get.return_value = mock_response({"timeSecond": "1700000000"})
+        return a
+
+    def test_connect_syncs_time(self, lazy_adapter):
+        with patch.object(lazy_adapter, "_new_session", return_value=lazy_adapter._session):
+            lazy_adapter.connect()
+        assert lazy_adapter.connected is True
+        assert lazy_adapter._time_synced_at is not None
+        assert lazy_adapter._session.get.call_args.args[0].endswith("/v5/market/time")
+
+    def test_unsigned_call_skips_time_probe(self, lazy_adapter, price_message):
+        lazy_adapter.send(price_message)
+        urls = [c.args[0] for c in lazy_adapter._session.get.call_args_list]
+        assert not any(url.endswith("/v5/market/time") for url in urls)
+        assert lazy_adapter._time_synced_at is None
+
+    def test_signed_calls_sync_once(self, lazy_adapter, status_message, balance_message):
+        lazy_adapter.send(status_message)
+        lazy_adapter.send(balance_message)
+        urls = [c.args[0] for c in lazy_adapter._session.get.call_args_list]
+        assert sum(url.endswith("/v5/market/time") for url in urls) == 1
+
+    def test_resync_after_interval(self, lazy_adapter, status_message):
+        lazy_adapter.send(status_message)
+        lazy_adapter._time_synced_at -= lazy_adapter._time_sync_interval
+        lazy_adapter.send(status_message)
+        urls = [c.args[0] for c in lazy_adapter._session.get.call_args_list]
+        assert sum(url.endswith("/v5/market/time") for url in urls) == 2
+
+    def test_sync_connection_error(self, lazy_adapter, status_message):
+        lazy_adapter._session.get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(AdapterConnectionError, match="Cannot reach"):
+            lazy_adapter.send(status_message)
+
+    def test_sync_timeout(self, lazy_adapter, status_message):
+        lazy_adapter._session.get.side_effect = requests.ReadTimeout("slow")
+        with pytest.raises(AdapterConnectionError, match="timed out"):
+            lazy_adapter.send(status_message)
+
+    def test_missing_key_skips_time_probe(self, lazy_adapter, status_message):
+        lazy_adapter._api_key = None
+        with pytest.raises(AdapterError, match="API key and secret required"):
+            lazy_adapter.send(status_message)
+        lazy_adapter._session.get.assert_not_called()
+
+    def test_async_sync_uses_async_client(self, status_message, balance_message):
+        adapter = BybitAdapter(api_key="test-key", api_secret="test-secret")
+
+        async def run():
+            async with adapter:
+                client = adapter._async_client
+                await adapter.send_many([status_message, balance_message])
+            return client
+
+        with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=TimeCountingClient)):
+            client = asyncio.run(run())
+        assert client.time_probes == 1
+        assert adapter._time_synced_at is not None
+        assert adapter._session is None
+
+    def test_cancelled_caller_keeps_shared_time_probe(self, status_message, balance_message):
+        adapter = BybitAdapter(api_key="test-key", api_secret="test-secret")
+
+        async def run():
+            async with adapter:
+                first = asyncio.ensure_future(adapter.send_async(status_message))
+                second = asyncio.ensure_future(adapter.send_async(balance_message))
+                await asyncio.sleep(0.001)  # Both now wait on the time probe
+                first.cancel()
+                response = await second
+                with pytest.raises(asyncio.CancelledError):
+                    await first
+                return response
+
+        with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=SlowTimeClient)):
+            response = asyncio.run(run())
+        assert response.type == "RESPONSE"
+        assert adapter._time_synced_at is not None
+
+    def test_async_sync_timeout(self, status_message):
+        adapter = BybitAdapter(api_key="test-key", api_secret="test-secret")
+        adapter._async_client = MagicMock()
+        adapter._async_client.get = AsyncMock(side_effect=TimeoutError("slow"))
+        with pytest.raises(AdapterConnectionError, match="timed out"):
+            asyncio.run(adapter.send_async(status_message))
+        assert adapter._session is None
+
 
 # --- Test to_native: Market Data ---
 
@@ -145,6 +307,14 @@ class TestToNativeMarketData:
         native = adapter.to_native(msg)
         assert native["params"]["symbol"] == "BTCUSDT"
 
+    def test_symbol_normalized_for_all_builders(self, adapter):
+        msg = PulseMessage(
+            action="ACT.CANCEL", parameters={"symbol": "ethusdt", "order_id": "1"}, validate=False
+        )
+        native = adapter.to_native(msg)
+        assert native["params"]["symbol"] == "ETHUSDT"
+        assert msg.content["parameters"]["symbol"] == "ethusdt"
+
     def test_unknown_query_type_raises(self, adapter):
         msg = PulseMessage(action="ACT.QUERY.DATA", parameters={"type": "invalid"})
         with pytest.raises(AdapterError, match="Unknown query type"):
@@ -302,6 +472,18 @@ class TestCallAPI:
                 "signed": False,
             })
 
+    def test_non_json_body(self, adapter):
+        resp = MagicMock()
+        resp.content = b"<html>502 Bad Gateway</html>"
+        adapter._session.get.return_value = resp
+        with pytest.raises(AdapterError, match="non-JSON body"):
+            adapter.call_api({
+                "method": "GET",
+                "endpoint": "/v5/market/tickers",
+                "params": {"symbol": "BTCUSDT"},
+                "signed": False,
+            })
+
     def test_connection_error(self, adapter):
         adapter._session.get.side_effect = ConnectionError("Network down")
         with pytest.raises(AdapterConnectionError, match="Cannot reach"):
@@ -312,6 +494,87 @@ class TestCallAPI:
             })
 
 
+# --- Test Response Cache ---
+
+
+class TestResponseCache:
+
+    def test_repeated_query_served_from_cache(self, adapter, price_message):
+        adapter._session.get.return_value = mock_response({"list": []})
+        adapter.send(price_message)
+        adapter.send(price_message)
+        assert adapter._session.get.call_count == 1
+
+    def test_cache_expires(self, adapter, price_message):
+        adapter._session.get.return_value = mock_response({"list": []})
+        with patch("pulse_bybit.adapter.time.monotonic", side_effect=[100.0, 101.0, 101.0]):
+            adapter.send(price_message)
+            adapter.send(price_message)
+        assert adapter._session.get.call_count == 2
+
+    def test_fresh_bypasses_cache(self, adapter, price_message):
+        adapter._session.get.return_value = mock_response({"list": []})
+        adapter.send(price_message)
+        fresh = PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"symbol": "BTCUSDT", "fresh": True}
+        )
+        adapter.send(fresh)
+        assert adapter._session.get.call_count == 2
+
+    def test_signed_requests_not_cached(self, adapter, status_message):
+        adapter._session.get.return_value = mock_response({"list": []})
+        adapter.send(status_message)
+        adapter.send(status_message)
+        assert adapter._session.get.call_count == 2
+
+    def test_errors_not_cached(self, adapter, price_message):
+        adapter._session.get.return_value = mock_response({}, ret_code=10001, ret_msg="Bad")
+        with pytest.raises(AdapterError):
+            adapter.send(price_message)
+        adapter._session.get.return_value = mock_response({"list": []})
+        response = adapter.send(price_message)
+        assert response.content["parameters"]["result"] == {"list": []}
+
+    def test_mutating_response_does_not_touch_cache(self, adapter, price_message):
+        adapter._session.get.return_value = mock_response({"list": [{"symbol": "BTCUSDT"}]})
+        first = adapter.send(price_message)
+        first.content["parameters"]["result"]["list"].clear()
+        second = adapter.send(price_message)
+        assert adapter._session.get.call_count == 1
+        assert second.content["parameters"]["result"] == {"list": [{"symbol": "BTCUSDT"}]}
+
+    def test_cache_size_bounded(self, adapter):
+        adapter._session.get.return_value = mock_response({"list": []})
+        with patch("pulse_bybit.adapter.CACHE_MAX_ENTRIES", 3):
+            for limit in range(5):
+                adapter.call_api({
+                    "method": "GET",
+                    "endpoint": "/v5/market/kline",
+                    "params": {"category": "spot", "symbol": "BTCUSDT", "limit": limit},
+                    "signed": False,
+                })
+        assert len(adapter._cache) == 3
+        limits = [dict(key[1])["limit"] for key in adapter._cache]
+        assert limits == [2, 3, 4]
+
+    def test_expired_entries_purged_on_put(self, adapter):
+        adapter._session.get.return_value = mock_response({"list": []})
+        adapter._cache[("/v5/market/kline", ())] = (0.0, b"{}")
+        with patch("pulse_bybit.adapter.CACHE_MAX_ENTRIES", 1):
+            adapter.send(PulseMessage(action="ACT.QUERY.DATA", parameters={"symbol": "BTCUSDT"}))
+        assert ("/v5/market/kline", ()) not in adapter._cache
+        assert len(adapter._cache) == 1
+
+    def test_cache_ttl_config(self):
+        adapter = BybitAdapter(config={"cache_ttl": {"tickers": 0}})
+        assert "/v5/market/tickers" not in adapter._cache_ttl
+        assert adapter._cache_ttl["/v5/market/kline"] == 1.0
+
+    def test_cache_ttl_unknown_name_raises(self):
+        with pytest.raises(AdapterError, match=r"Unknown cache_ttl.*'ticker'.*Valid"):
+            BybitAdapter(config={"cache_ttl": {"ticker": 1}})
+
+
 # --- Test Full Pipeline ---
 
 
@@ -340,6 +603,217 @@ class TestFullPipeline:
         assert adapter._request_count == 2
 
 
+# --- Test Async Transport ---
+
+
+class TestAsyncTransport:
+
+    @pytest.fixture
+    def async_adapter(self, adapter):
+        adapter._async_client = MagicMock()
+        adapter._async_client.get = AsyncMock()
+        adapter._async_client.post = AsyncMock()
+        return adapter
+
+    def test_send_async(self, async_adapter, price_message):
+        async_adapter._async_client.get.return_value = mock_response(
+            {"list": [{"symbol": "BTCUSDT", "lastPrice": "65000"}]}
+        )
+        response = asyncio.run(async_adapter.send_async(price_message))
+        assert response.type == "RESPONSE"
+        assert response.envelope["sender"] == "adapter:bybit"
+        assert response.content["parameters"]["result"]["list"][0]["lastPrice"] == "65000"
+        async_adapter._session.get.assert_not_called()
+
+    def test_send_many_preserves_order(self, async_adapter, price_message, buy_message):
+        async_adapter._async_client.get.return_value = mock_response({"list": []})
+        async_adapter._async_client.post.return_value = mock_response({"orderId": "o-1"})
+        responses = asyncio.run(async_adapter.send_many([price_message, buy_message]))
+        assert responses[0].content["parameters"]["result"] == {"list": []}
+        assert responses[1].content["parameters"]["result"]["orderId"] == "o-1"
+        assert async_adapter._request_count == 2
+
+    def test_async_api_error(self, async_adapter, price_message):
+        async_adapter._async_client.get.return_value = mock_response(
+            {}, ret_code=10001, ret_msg="Invalid symbol"
+        )
+        with pytest.raises(AdapterError, match="Invalid symbol"):
+            asyncio.run(async_adapter.send_async(price_message))
+        assert async_adapter._error_count == 1
+
+    def test_async_connection_error(self, async_adapter, price_message):
+        async_adapter._async_client.get.side_effect = ConnectionError("Network down")
+        with pytest.raises(AdapterConnectionError, match="Cannot reach"):
+            asyncio.run(async_adapter.send_async(price_message))
+
+    def test_send_many_across_event_loops(self, adapter):
+        msg = PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"symbol": "BTCUSDT", "fresh": True}
+        )
+        with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=LoopBoundClient)):
+            for _ in range(2):
+                responses = asyncio.run(adapter.send_many([msg, msg]))
+                assert len(responses) == 2
+
+    def test_async_context_manager_closes_both_transports(self, adapter, price_message):
+        session = adapter._session
+
+        async def run():
+            async with adapter:
+                client = adapter._async_client
+                await adapter.send_async(price_message)
+            return client
+
+        with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=LoopBoundClient)):
+            client = asyncio.run(run())
+        assert client.closed is True
+        session.close.assert_called_once()
+        assert adapter._async_client is None
+        assert adapter._session is None
+
+    def test_disconnect_drops_async_client(self, adapter, price_message):
+        with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=LoopBoundClient)):
+            asyncio.run(adapter.send_async(price_message))
+        assert adapter._async_client is not None
+        adapter.disconnect()
+        assert adapter._async_client is None
+
+    def test_switch_from_idle_open_loop(self, adapter):
+        msg = PulseMessage(
+            action="ACT.QUERY.DATA", parameters={"symbol": "BTCUSDT", "fresh": True}
+        )
+        loop = asyncio.new_event_loop()
+        try:
+            with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=LoopBoundClient)):
+                loop.run_until_complete(adapter.send_async(msg))
+                response = asyncio.run(adapter.send_async(msg))
+            assert response.type == "RESPONSE"
+            assert adapter._async_loop is not loop
+        finally:
+            loop.close()
+
+    def test_disconnect_closes_client_on_idle_loop(self, adapter, price_message):
+        loop = asyncio.new_event_loop()
+        try:
+            with patch("pulse_bybit.adapter.httpx", MagicMock(AsyncClient=LoopBoundClient)):
+                loop.run_until_complete(adapter.send_async(price_message))
+            client = adapter._async_client
+            adapter.disconnect()
+            assert client.closed is True
+            assert adapter._async_client is None
+        finally:
+            loop.close()
+
+    def test_async_requires_httpx(self, adapter, price_message):
+        with patch("pulse_bybit.adapter.httpx", None):
+            with pytest.raises(AdapterError, match="requires httpx"):
+                asyncio.run(adapter.send_async(price_message))
+
+
+# --- Test Batch Send ---
+
+
+class TestSendBatch:
+
+    def _price(self, symbol, **extra):
+        return PulseMessage(action="ACT.QUERY.DATA", parameters={"symbol": symbol, **extra})
+
+    def test_tickers_coalesced(self, adapter):
+        adapter._session.get.return_value = mock_response({
+            "category": "spot",
+            "list": [
+                {"symbol": "BTCUSDT", "lastPrice": "65000"},
+                {"symbol": "ETHUSDT", "lastPrice": "3500"},
+                {"symbol": "SOLUSDT", "lastPrice": "150"},
+            ],
+        })
+        responses = adapter.send_batch([self._price("ETHUSDT"), self._price("btcusdt")])
+        assert adapter._session.get.call_count == 1
+        assert "symbol" not in adapter._session.get.call_args.kwargs["params"]
+        assert responses[0].content["parameters"]["result"]["list"] == [
+            {"symbol": "ETHUSDT", "lastPrice": "3500"}
+        ]
+        assert responses[1].content["parameters"]["result"]["list"][0]["lastPrice"] == "65000"
+        assert responses[1].type == "RESPONSE"
+        assert responses[1].envelope["sender"] == "adapter:bybit"
+        assert adapter._request_count == 2
+
+    def test_other_actions_sent_individually(self, adapter, buy_message):
+        adapter._session.get.return_value = mock_response(
+            {"list": [{"symbol": "BTCUSDT"}, {"symbol": "ETHUSDT"}]}
+        )
+        adapter._session.post.return_value = mock_response({"orderId": "o-1"})
+        responses = adapter.send_batch(
+            [self._price("BTCUSDT"), buy_message, self._price("ETHUSDT")]
+        )
+        assert adapter._session.get.call_count == 1
+        assert adapter._session.post.call_count == 1
+        assert responses[1].content["parameters"]["result"]["orderId"] == "o-1"
+
+    def test_categories_not_mixed(self, adapter):
+        adapter._session.get.return_value = mock_response({"list": [{"symbol": "BTCUSDT"}]})
+        adapter.send_batch([self._price("BTCUSDT"), self._price("BTCUSDT", category="linear")])
+        categories = [c.kwargs["params"]["category"] for c in adapter._session.get.call_args_list]
+        assert sorted(categories) == ["linear", "spot"]
+
+    def test_missing_symbol_falls_back_to_send(self, adapter):
+        adapter._session.get.side_effect = [
+            mock_response({"list": [{"symbol": "BTCUSDT"}]}),
+            mock_response({}, ret_code=10001, ret_msg="Invalid symbol"),
+        ]
+        responses = adapter.send_batch([self._price("BTCUSDT"), self._price("NOPEUSDT")])
+        assert responses[0].type == "RESPONSE"
+        assert responses[1].type == "ERROR"
+        assert "Invalid symbol" in responses[1].content["parameters"]["error"]
+        health = adapter.health_check()
+        assert (health["requests"], health["errors"]) == (2, 1)
+
+    def test_failed_bulk_call_falls_back_per_message(self, adapter, buy_message):
+        adapter._session.get.side_effect = [
+            mock_response({}, ret_code=10016, ret_msg="Service unavailable"),
+            mock_response({"list": [{"symbol": "BTCUSDT", "lastPrice": "65000"}]}),
+            mock_response({"list": [{"symbol": "ETHUSDT", "lastPrice": "3500"}]}),
+        ]
+        adapter._session.post.return_value = mock_response({"orderId": "o-1"})
+        responses = adapter.send_batch(
+            [self._price("BTCUSDT"), self._price("ETHUSDT"), buy_message]
+        )
+        assert responses[0].content["parameters"]["result"]["list"][0]["lastPrice"] == "65000"
+        assert responses[1].content["parameters"]["result"]["list"][0]["lastPrice"] == "3500"
+        assert responses[2].content["parameters"]["result"]["orderId"] == "o-1"
+        health = adapter.health_check()
+        assert (health["requests"], health["errors"]) == (3, 0)
+
+    def test_failed_fallback_counts_each_message_once(self, adapter):
+        adapter._session.get.side_effect = ConnectionError("Network down")
+        responses = adapter.send_batch([self._price("BTCUSDT"), self._price("ETHUSDT")])
+        assert [r.content["action"] for r in responses] == ["META.ERROR.UNAVAILABLE"] * 2
+        health = adapter.health_check()
+        assert (health["requests"], health["errors"]) == (2, 2)
+
+    def test_failing_fallback_does_not_drop_later_messages(self, adapter, buy_message):
+        adapter._session.get.side_effect = ConnectionError("Network down")
+        adapter._session.post.return_value = mock_response({"orderId": "o-1"})
+        btc, eth = self._price("BTCUSDT"), self._price("ETHUSDT")
+        responses = adapter.send_batch([btc, eth, buy_message])
+        assert responses[0].type == "ERROR"
+        assert responses[0].content["parameters"]["in_reply_to"] == btc.envelope["message_id"]
+        assert responses[1].type == "ERROR"
+        assert responses[2].content["parameters"]["result"]["orderId"] == "o-1"
+        adapter._session.post.assert_called_once()
+        health = adapter.health_check()
+        assert (health["requests"], health["errors"]) == (3, 2)
+
+    def test_execution_order_preserved(self, adapter, buy_message):
+        adapter._session.get.return_value = mock_response(
+            {"list": [{"symbol": "BTCUSDT"}, {"symbol": "ETHUSDT"}]}
+        )
+        adapter._session.post.return_value = mock_response({"orderId": "o-1"})
+        adapter.send_batch([buy_message, self._price("BTCUSDT"), self._price("ETHUSDT")])
+        calls = [name for name, _, _ in adapter._session.mock_calls if name in ("get", "post")]
+        assert calls == ["post", "get"]
+
+
 # --- Test Signing ---
 
 
@@ -347,7 +821,8 @@ class TestSigning:
 
     def test_sign_get_headers(self, adapter):
         params = {"category": "spot", "symbol": "BTCUSDT"}
-        headers = adapter._sign_get(params)
+        headers, query = adapter._sign_get(params)
+        assert query == "category=spot&symbol=BTCUSDT"
         assert "X-BAPI-API-KEY" in headers
         assert "X-BAPI-SIGN" in headers
         assert "X-BAPI-TIMESTAMP" in headers
@@ -356,9 +831,78 @@ class TestSigning:
 
     def test_sign_post_headers(self, adapter):
         params = {"symbol": "BTCUSDT", "side": "Buy"}
-        headers = adapter._sign_post(params)
+        headers, body = adapter._sign_post(params)
         assert "X-BAPI-SIGN" in headers
         assert "Content-Type" in headers
+        assert body == b'{"symbol":"BTCUSDT","side":"Buy"}'
+
+    def test_post_sends_signed_body(self, adapter):
+        adapter._session.post.return_value = mock_response({"orderId": "abc123"})
+        adapter.call_api({
+            "method": "POST",
+            "endpoint": "/v5/order/create",
+            "params": {"symbol": "BTCUSDT", "side": "Buy", "qty": "0.001"},
+            "signed": True,
+        })
+        sent = adapter._session.post.call_args.kwargs
+        body = sent["data"]
+        assert "json" not in sent
+        assert body == b'{"symbol":"BTCUSDT","side":"Buy","qty":"0.001"}'
+
+        headers = sent["headers"]
+        sign_str = f"{headers['X-BAPI-TIMESTAMP']}test-key20000".encode() + body
+        expected = hmac.new(b"test-secret", sign_str, hashlib.sha256).hexdigest()
+        assert headers["X-BAPI-SIGN"] == expected
+
+    def test_sign_get_signature(self, adapter):
+        params = {"category": "spot", "symbol": "BTCUSDT"}
+        headers, _ = adapter._sign_get(params)
+        sign_str = f"{headers['X-BAPI-TIMESTAMP']}test-key20000category=spot&symbol=BTCUSDT"
+        expected = hmac.new(b"test-secret", sign_str.encode(), hashlib.sha256).hexdigest()
+        assert headers["X-BAPI-SIGN"] == expected
+
+    def test_sign_get_pinned_signature(self, adapter):
+        params = {"category": "spot", "symbol": "BTCUSDT", "orderId": "abc123"}
+        with patch.object(adapter, "_timestamp", return_value="1700000000000"):
+            headers, query = adapter._sign_get(params)
+        # Query keeps builder (insertion) order; it is signed and sent as-is
+        assert query == "category=spot&symbol=BTCUSDT&orderId=abc123"
+        assert headers["X-BAPI-SIGN"] == (
+            "5bc5fe01ac49e6f21ab1293a6caf33fbe7afe45ce7ac42066a41cecc771763eb"
+        )
+
+    def test_get_sends_signed_query(self, adapter):
+        adapter._session.get.return_value = mock_response({"list": []})
+        adapter.call_api({
+            "method": "GET",
+            "endpoint": "/v5/order/realtime",
+            "params": {"category": "spot", "orderLinkId": "a&b=c"},
+            "signed": True,
+        })
+        url = adapter._session.get.call_args.args[0]
+        assert url.endswith("/v5/order/realtime?category=spot&orderLinkId=a%26b%3Dc")
+        assert adapter._session.get.call_args.kwargs["params"] is None
+
+    def test_hmac_template_reused(self, adapter):
+        adapter._sign_get({"category": "spot"})
+        template = adapter._hmac_template
+        adapter._sign_post({"category": "spot"})
+        assert adapter._hmac_template is template
+
+    def test_signing_batch_shares_timestamp(self, adapter):
+        with adapter.signing_batch():
+            first, _ = adapter._sign_get({"category": "spot"})
+            with patch("pulse_bybit.adapter.time.time_ns", return_value=0):
+                second, _ = adapter._sign_post({"category": "spot"})
+        assert first["X-BAPI-TIMESTAMP"] == second["X-BAPI-TIMESTAMP"]
+        assert adapter._batch_ts is None
+
+    def test_timestamp_applies_server_offset(self, adapter):
+        adapter._time_offset_ns = 2_500_000_000
+        with patch("pulse_bybit.adapter.time.time_ns", return_value=1_700_000_000_123_456_789):
+            headers, _ = adapter._sign_get({"category": "spot"})
+        assert headers["X-BAPI-TIMESTAMP"] == "1700000002623"
+        assert adapter._time_offset == 2500
 
     def test_sign_without_key_raises(self, adapter):
         adapter._api_key = None
@@ -377,6 +921,16 @@ class TestSupportedActions:
         assert "ACT.TRANSACT.REQUEST" in actions
         assert "ACT.CANCEL" in actions
         assert len(actions) == 6
+        assert adapter.supported_actions is actions
+
+    def test_action_map_keeps_operation_names(self):
+        from pulse_bybit.adapter import ACTION_MAP
+        assert ACTION_MAP["ACT.QUERY.DATA"] == "query"
+        assert ACTION_MAP["ACT.TRANSACT.REQUEST"] == "place_order"
+
+    def test_every_action_has_builder(self, adapter):
+        assert set(adapter._builders) == set(adapter.supported_actions)
+        assert all(callable(builder) for builder in adapter._builders.values())
 
     def test_supports_check(self, adapter):
         assert adapter.supports("ACT.QUERY.DATA") is True